@@ -1,5 +1,57 @@
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Larger buffer for the generic copyfileobj fallback (default is 64 KiB)
+shutil.COPY_BUFSIZE = 1024 * 1024
+
+def copy_file(src, dst):
+    """
+    Copy a file with the cheapest kernel primitive available, keeping metadata like copy2.
+
+    Windows: CopyFileW (server-side copy on shares).
+    Linux: copy_file_range (reflink on btrfs/xfs), then sendfile, then a 1 MiB buffer copy.
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            return
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(infd).st_size
+        copied = 0
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(infd, outfd, size - copied, copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                pass
+
+        if copied < size and hasattr(os, 'sendfile'):
+            fdst.seek(copied)
+            try:
+                while copied < size:
+                    n = os.sendfile(outfd, infd, copied, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                pass
+
+        if copied < size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+
+    shutil.copystat(src, dst)
 
 # Source directories
 source_dirs = ['basic', 'intermediate', 'advanced']
@@ -9,15 +61,21 @@ dest_dir = os.path.join(base_path, 'all')
 # Create destination directory if it doesn't exist
 os.makedirs(dest_dir, exist_ok=True)
 
-# Copy all mp3 files from source directories to dest_dir
+# Collect (src, dst) pairs from all source directories in one scandir pass each
+pairs = []
 for src_dir in source_dirs:
     src_path = os.path.join(base_path, src_dir)
-    if os.path.exists(src_path):
-        for file in os.listdir(src_path):
-            if file.endswith('.mp3'):
-                src_file = os.path.join(src_path, file)
-                dest_file = os.path.join(dest_dir, file)
-                shutil.copy2(src_file, dest_file)
-                print(f"Copied {src_file} to {dest_file}")
+    try:
+        with os.scandir(src_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.mp3') and entry.is_file():
+                    pairs.append((entry.path, os.path.join(dest_dir, entry.name)))
+    except FileNotFoundError:
+        continue
+
+# Copy all mp3 files to dest_dir; copies are independent and I/O-bound
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(lambda pair: copy_file(*pair), pairs))
 
+print(f"Copied {len(pairs)} files to {dest_dir}")
 print("Audio compilation for 'all' levels completed.")
\ No newline at end of file
@@ -4,45 +4,99 @@ Auto-generate placeholder audio files for all Chinese tokens across all matrix f
 """
 
 import csv
+import os
 from pathlib import Path
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Minimal MP3 placeholder bytes
+MINIMAL_MP3 = bytes([
+    0xFF, 0xFB, 0x10, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,
+])
+
+# Create-only flags: O_EXCL makes the "does it exist" check part of the open
+# itself; O_BINARY keeps Windows from translating bytes
+CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Characters that cannot appear in a file name, mapped in one C-level pass
+_SAFE = str.maketrans({' ': '_', '/': '_'})
+
+def load_words(vocab_files):
+    """
+    Return the set of unique, stripped Word values across vocabulary CSVs.
+
+    Uses pandas' C parser restricted to the Word column when available,
+    otherwise csv.reader with the column index looked up once per file.
+    """
+    if pd is not None:
+        columns = [
+            # keep_default_na=False: words like "NA" or "null" stay literal strings.
+            # index_col=False: a trailing comma on every row must not turn the
+            # first column into the index and shift Word onto the next column
+            pd.read_csv(f, usecols=lambda c: c == 'Word', dtype=str,
+                        keep_default_na=False, index_col=False)
+            for f in vocab_files
+        ]
+        words = [df['Word'] for df in columns if 'Word' in df]
+        if not words:
+            return set()
+        series = pd.concat(words).str.strip()
+        return set(series[series != ''].unique())
+
+    all_words = set()
+    for vocab_file in vocab_files:
+        with open(vocab_file, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'Word' not in header:
+                continue
+            word_idx = header.index('Word')
+            for row in reader:
+                if word_idx < len(row):
+                    word = row[word_idx].strip()
+                    if word:
+                        all_words.add(word)
+    return all_words
+
 def create_placeholder_audio():
     data_dir = Path(__file__).parent / 'data'
     audio_dir = Path(__file__).parent / 'assets' / 'audio'
     audio_dir.mkdir(parents=True, exist_ok=True)
     
-    # Minimal MP3 placeholder bytes
-    minimal_mp3 = bytes([
-        0xFF, 0xFB, 0x10, 0x00,
-        0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00,
-    ])
-    
     created_count = 0
-    all_words = set()
     
     # Find all CSV files with vocabulary
     vocab_files = list(data_dir.glob('chinese_*.csv'))
+    all_words = load_words(vocab_files)
     
-    for vocab_file in vocab_files:
-        with open(vocab_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                word = row.get('Word', '').strip()
-                if word:
-                    all_words.add(word)
+    # One directory listing instead of a stat per word
+    existing = {entry.name for entry in os.scandir(audio_dir)}
+    audio_root = str(audio_dir)
     
     # Create audio files
     for word in all_words:
-        safe_filename = word.replace(' ', '_').replace('/', '_')
-        audio_file = audio_dir / f"{safe_filename}.mp3"
+        safe_filename = word.translate(_SAFE)
+        filename = f"{safe_filename}.mp3"
         
-        if not audio_file.exists():
-            with open(audio_file, 'wb') as f:
-                f.write(minimal_mp3)
-            created_count += 1
+        if filename in existing:
+            continue
+        try:
+            fd = os.open(os.path.join(audio_root, filename), CREATE_FLAGS, 0o644)
+        except FileExistsError:
+            # Created since the directory was listed
+            continue
+        try:
+            os.write(fd, MINIMAL_MP3)
+        finally:
+            os.close(fd)
+        created_count += 1
     
     print(f"Generated {created_count} new placeholder audio files")
     print(f"Total unique words: {len(all_words)}")
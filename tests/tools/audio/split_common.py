@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared implementation for the audio splitting scripts.
+
+Every splitter loads a recording, detects the words by silence and exports one
+file per word. Decoded audio and detected segments are cached per path, so
+running several splits in one interpreter session does the work once.
+"""
+
+import argparse
+import os
+
+from fast_silence import (
+    load_audio, detect_nonsilent_file, export_segments_parallel,
+    ffmpeg_detect_nonsilent, ffmpeg_export_segments,
+)
+
+AUDIO_BASE = r"d:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\assets\audio"
+
+# Padding added around each detected word so onsets/tails are not clipped
+PADDING_MS = 50
+
+# Unnormalized WebM output, matching the original recordings
+WEBM_EXPORT = {'format': 'webm', 'bitrate': '128k', 'parameters': (), 'mono': False, 'normalize': False}
+WEBM_FFMPEG_ARGS = ('-c:a', 'libopus', '-b:a', '128k')
+
+
+def load(path):
+    """
+    Decoded AudioSegment for path (cached per process).
+    """
+    return load_audio(path)
+
+
+def detect(path, min_silence_len=300, silence_thresh=-40, seek_step=50):
+    """
+    Non-silent (start_ms, end_ms) segments for path (cached per process).
+    """
+    return detect_nonsilent_file(path, min_silence_len, silence_thresh, seek_step)
+
+
+def export_segments(audio, segments, mapping, out_dir, **export_options):
+    """
+    Pad each segment and export it to out_dir under the matching mapping name.
+
+    Args:
+        audio: Source AudioSegment
+        segments: (start_ms, end_ms) pairs from detect()
+        mapping: Output file names in segment order; None names files word_XXX.webm
+        out_dir: Output directory
+        export_options: Passed to export_segments_parallel (format, bitrate, mono, ...)
+
+    Returns the number of files written.
+    """
+    if mapping is None:
+        mapping = [f"word_{idx:03d}.webm" for idx in range(1, len(segments) + 1)]
+
+    jobs = []
+    for (start, end), name in zip(segments, mapping):
+        padded_start = max(0, start - PADDING_MS)
+        padded_end = min(len(audio), end + PADDING_MS)
+        jobs.append((padded_start, padded_end, os.path.join(out_dir, name)))
+
+    for job_idx in export_segments_parallel(audio, jobs, **export_options):
+        padded_start, padded_end, _ = jobs[job_idx]
+        print(f"  {job_idx + 1:3d}. {mapping[job_idx]:<14} {padded_end - padded_start:4d}ms")
+
+    return len(jobs)
+
+
+def export_segments_ffmpeg(audio_path, segments, out_dir):
+    """
+    Cut word_XXX.webm files straight from audio_path with FFmpeg (no Python decode).
+
+    Returns the number of files written.
+    """
+    # FFmpeg stops at end of input, so the tail padding needs no clamp
+    jobs = [
+        (max(0, start - PADDING_MS), end + PADDING_MS, os.path.join(out_dir, f"word_{idx:03d}.webm"))
+        for idx, (start, end) in enumerate(segments, 1)
+    ]
+
+    for job_idx in ffmpeg_export_segments(audio_path, jobs, audio_args=WEBM_FFMPEG_ARGS):
+        padded_start, padded_end, output_file = jobs[job_idx]
+        print(f"  {job_idx + 1:3d}. {padded_end - padded_start:4d}ms -> {os.path.basename(output_file)}")
+
+    return len(jobs)
+
+
+def split_audio(audio_path, output_dir, mapping=None, label="audio", seek_step=50,
+                use_ffmpeg=False, **export_options):
+    """
+    Detect words in audio_path and export one file per word to output_dir.
+
+    Args:
+        audio_path: Input recording
+        output_dir: Directory for the split files
+        mapping: Output names in recording order (None: word_XXX.webm)
+        label: Name used in progress output
+        seek_step: Silence detection step in ms
+        use_ffmpeg: Detect and cut entirely inside FFmpeg (word_XXX.webm only)
+        export_options: Passed to export_segments
+
+    Returns True on success.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"\n{'=' * 70}")
+    print(f"{label.upper()} - SPLITTING BY SILENCE")
+    print(f"{'=' * 70}")
+    print(f"Input:  {os.path.basename(audio_path)}")
+    print(f"Output: {output_dir}\n")
+
+    try:
+        if use_ffmpeg:
+            segments = ffmpeg_detect_nonsilent(audio_path, min_silence_len=300, silence_thresh=-40)
+        else:
+            audio = load(audio_path)
+            print(f"✓ Audio loaded: {len(audio)}ms, {audio.channels}ch, {audio.frame_rate}Hz")
+            segments = detect(audio_path, seek_step=seek_step)
+
+        print(f"✓ Detected {len(segments)} words")
+        if mapping is not None and len(segments) != len(mapping):
+            print(f"⚠ Warning: Detected {len(segments)} segments but expected {len(mapping)}")
+
+        print("\n  Splitting...\n")
+        if use_ffmpeg:
+            count = export_segments_ffmpeg(audio_path, segments, output_dir)
+        else:
+            count = export_segments(audio, segments, mapping, output_dir, **export_options)
+
+        print(f"\n✓ {label}: {count} files written to {output_dir}")
+        return True
+
+    except Exception as e:
+        print(f"\n✗ Error processing {label}: {e}")
+        print("Note: Make sure FFmpeg is installed on your system for WebM support")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def parse_args(description, seek_step=True):
+    """
+    Parse the splitter command line. seek_step=False leaves out --seek-step
+    for scripts that detect silence in FFmpeg, which has no seek step.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    if seek_step:
+        parser.add_argument('--seek-step', type=int, default=50,
+                            help='Silence detection step in ms (default: 50, well under the 300ms min silence)')
+    return parser.parse_args()
+
+
+def run(jobs, seek_step=50):
+    """
+    Run split_audio for each (label, audio_path, output_dir, mapping, export_options)
+    job, print a summary, and return a process exit code.
+    """
+    results = []
+    for label, audio_path, output_dir, mapping, export_options in jobs:
+        if not os.path.exists(audio_path):
+            print(f"\n✗ {label} audio not found: {audio_path}")
+            results.append((label, False))
+            continue
+        success = split_audio(audio_path, output_dir, mapping, label=label,
+                              seek_step=seek_step, **export_options)
+        results.append((label, success))
+
+    print(f"\n{'=' * 70}")
+    print("SUMMARY")
+    print(f"{'=' * 70}")
+    for label, success in results:
+        status = "✓ Success" if success else "✗ Failed"
+        print(f"{label:15} {status}")
+    print(f"{'=' * 70}\n")
+
+    return 0 if all(success for _, success in results) else 1
@@ -0,0 +1,89 @@
+"""
+Test that generate_audio_placeholders.load_words returns the same words with
+pandas as with the csv.reader fallback.
+The fixture covers:
+1. A trailing comma on every row of a file
+2. A trailing comma on some rows, short rows and blank lines
+3. Words pandas would read as NA ("NA", "null") and surrounding whitespace
+4. A file without a Word column
+"""
+import os
+import tempfile
+
+import generate_audio_placeholders
+
+FIXTURE = {
+    # Trailing comma on every row
+    'chinese_basic.csv': (
+        'Category,Word,Pinyin,English\r\n'
+        'Pronoun,我,wo,I,\r\n'
+        'Pronoun,你,ni,you,\r\n'
+    ),
+    # Trailing comma on one row, NA-like words, padding, short and blank rows
+    'chinese_intermediate.csv': (
+        'Category,Word,Pinyin,English\n'
+        'Noun,NA,na,not available\n'
+        'Noun,null,null,null word,\n'
+        'Noun, 书 ,shu,book\n'
+        'Adverb\n'
+        '\n'
+        'Adverb,,,empty word\n'
+    ),
+    # No Word column
+    'chinese_other.csv': (
+        'Category,Pinyin\n'
+        'Noun,shui\n'
+    ),
+}
+
+EXPECTED = {'我', '你', 'NA', 'null', '书'}
+
+
+def write_fixture(tmp_dir):
+    paths = []
+    for name, text in FIXTURE.items():
+        path = os.path.join(tmp_dir, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        paths.append(path)
+    return paths
+
+
+def load_words_csv(paths):
+    """load_words with pandas disabled, so the csv.reader fallback runs"""
+    pd = generate_audio_placeholders.pd
+    generate_audio_placeholders.pd = None
+    try:
+        return generate_audio_placeholders.load_words(paths)
+    finally:
+        generate_audio_placeholders.pd = pd
+
+
+def test_load_words_parity():
+    """pandas and csv.reader load the same Word values"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = write_fixture(tmp_dir)
+
+        assert load_words_csv(paths) == EXPECTED, "csv fallback"
+        print("  csv: ✓ matches")
+
+        if generate_audio_placeholders.pd is None:
+            print("  pandas: skipped (pandas not installed)")
+            return
+        assert generate_audio_placeholders.load_words(paths) == EXPECTED, "pandas"
+        print("  pandas: ✓ matches")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: LOAD_WORDS PANDAS/CSV PARITY")
+    print("=" * 60)
+
+    test_load_words_parity()
+
+    print("\n" + "=" * 60)
+    print("ALL TESTS COMPLETE")
+    print("=" * 60)
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,12 @@ Verifies that all audio files exist and are properly sized for caching
 """
 
 import os
+import sys
 import json
 from pathlib import Path
 
+BYTES_PER_MB = 1048576
+
 def verify_audio_files():
     """Verify all audio files exist and calculate storage"""
     
@@ -20,26 +23,39 @@ def verify_audio_files():
     }
     
     results = {}
+    # Output is collected and written once at the end
+    lines = []
     total_size = 0
     total_files = 0
     
-    print("=" * 70)
-    print("AUDIO CACHE SYSTEM VERIFICATION")
-    print("=" * 70)
+    lines.append("=" * 70)
+    lines.append("AUDIO CACHE SYSTEM VERIFICATION")
+    lines.append("=" * 70)
     
     for level, expected_count in levels.items():
         level_path = base_path / level
-        audio_files = list(level_path.glob("*.mp3"))
-        
-        actual_count = len(audio_files)
-        level_size = sum(f.stat().st_size for f in audio_files)
+        # Single scandir pass accumulating count, bytes and names; DirEntry
+        # caches stat info, so sizes cost no extra syscall on Windows
+        actual_count = 0
+        level_size = 0
+        names = []
+        try:
+            with os.scandir(level_path) as it:
+                for e in it:
+                    if e.name.lower().endswith('.mp3'):
+                        actual_count += 1
+                        level_size += e.stat().st_size
+                        names.append(e.name)
+        except FileNotFoundError:
+            pass
+        names.sort()
         
         results[level] = {
             'expected': expected_count,
             'actual': actual_count,
-            'files': [f.name for f in sorted(audio_files)],
+            'files': names,
             'size_bytes': level_size,
-            'size_mb': round(level_size / (1024 * 1024), 2),
+            'size_mb': round(level_size / BYTES_PER_MB, 2),
             'avg_file_size_kb': round(level_size / actual_count / 1024, 1) if actual_count > 0 else 0
         }
         
@@ -49,41 +65,45 @@ def verify_audio_files():
         # Verify count
         status = "✓ OK" if actual_count == expected_count else f"✗ MISMATCH (expected {expected_count})"
         
-        print(f"\n{level.upper()} LEVEL {status}")
-        print(f"  Files: {actual_count}")
-        print(f"  Size: {results[level]['size_mb']} MB ({level_size:,} bytes)")
-        print(f"  Average file size: {results[level]['avg_file_size_kb']} KB")
+        lines.append(f"\n{level.upper()} LEVEL {status}")
+        lines.append(f"  Files: {actual_count}")
+        lines.append(f"  Size: {results[level]['size_mb']} MB ({level_size:,} bytes)")
+        lines.append(f"  Average file size: {results[level]['avg_file_size_kb']} KB")
+    
+    total_mb = total_size / BYTES_PER_MB
+    total_mb_rounded = round(total_mb, 2)
+    avg_kb = round(total_size / total_files / 1024, 1) if total_files > 0 else 0
     
     # Summary
-    print(f"\n{'=' * 70}")
-    print("SUMMARY")
-    print(f"{'=' * 70}")
-    print(f"Total audio files: {total_files}")
-    print(f"Total storage: {round(total_size / (1024 * 1024), 2)} MB ({total_size:,} bytes)")
-    print(f"Average file size: {round(total_size / total_files / 1024, 1)} KB")
+    lines.append(f"\n{'=' * 70}")
+    lines.append("SUMMARY")
+    lines.append(f"{'=' * 70}")
+    lines.append(f"Total audio files: {total_files}")
+    lines.append(f"Total storage: {total_mb_rounded} MB ({total_size:,} bytes)")
+    lines.append(f"Average file size: {avg_kb} KB")
     
     # Cache strategy estimates
-    print(f"\n{'=' * 70}")
-    print("CACHING ESTIMATES")
-    print(f"{'=' * 70}")
-    print(f"IndexedDB (7-day cache): ~{round(total_size / (1024 * 1024), 2)} MB")
-    print(f"Service Worker Cache (30-day): ~{round(total_size / (1024 * 1024), 2)} MB")
-    print(f"Typical Browser Cache Quota: 50-100 MB")
-    print(f"Estimated Cache Hit Rate: 80-95% after first week")
+    lines.append(f"\n{'=' * 70}")
+    lines.append("CACHING ESTIMATES")
+    lines.append(f"{'=' * 70}")
+    lines.append(f"IndexedDB (7-day cache): ~{total_mb_rounded} MB")
+    lines.append(f"Service Worker Cache (30-day): ~{total_mb_rounded} MB")
+    lines.append(f"Typical Browser Cache Quota: 50-100 MB")
+    lines.append(f"Estimated Cache Hit Rate: 80-95% after first week")
     
     # Cache behaviors
-    print(f"\n{'=' * 70}")
-    print("CACHING BEHAVIOR")
-    print(f"{'=' * 70}")
-    print("First Load:      Network download (slow, 1-5 sec per file)")
-    print("Second Load:     Service Worker Cache (fast, 50-200ms)")
-    print("Offline Access:  Cached files available")
-    print("Auto Refresh:    Every 60 minutes or on app update")
+    lines.append(f"\n{'=' * 70}")
+    lines.append("CACHING BEHAVIOR")
+    lines.append(f"{'=' * 70}")
+    lines.append("First Load:      Network download (slow, 1-5 sec per file)")
+    lines.append("Second Load:     Service Worker Cache (fast, 50-200ms)")
+    lines.append("Offline Access:  Cached files available")
+    lines.append("Auto Refresh:    Every 60 minutes or on app update")
     
     # Verification
-    print(f"\n{'=' * 70}")
-    print("VERIFICATION RESULTS")
-    print(f"{'=' * 70}")
+    lines.append(f"\n{'=' * 70}")
+    lines.append("VERIFICATION RESULTS")
+    lines.append(f"{'=' * 70}")
     
     all_ok = all(
         results[level]['actual'] == results[level]['expected']
@@ -91,28 +111,29 @@ def verify_audio_files():
     )
     
     if all_ok:
-        print("✓ All audio files verified and ready for caching")
+        lines.append("✓ All audio files verified and ready for caching")
     else:
-        print("✗ Some audio files are missing or mismatched")
+        lines.append("✗ Some audio files are missing or mismatched")
         for level, data in results.items():
             if data['actual'] != data['expected']:
-                print(f"  - {level}: {data['actual']} files (expected {data['expected']})")
+                lines.append(f"  - {level}: {data['actual']} files (expected {data['expected']})")
     
     # Output JSON summary
-    print(f"\n{'=' * 70}")
-    print("JSON SUMMARY")
-    print(f"{'=' * 70}")
+    lines.append(f"\n{'=' * 70}")
+    lines.append("JSON SUMMARY")
+    lines.append(f"{'=' * 70}")
     summary = {
         'total_files': total_files,
-        'total_size_mb': round(total_size / (1024 * 1024), 2),
+        'total_size_mb': total_mb_rounded,
         'total_size_bytes': total_size,
         'levels': results,
         'cache_ready': all_ok,
         'estimated_cache_time_seconds': round(total_files * 0.5),  # ~0.5 sec per file
-        'estimated_network_load_mb': round(total_size / (1024 * 1024) * 1.1, 2)  # 10% overhead
+        'estimated_network_load_mb': round(total_mb * 1.1, 2)  # 10% overhead
     }
     
-    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    lines.append(json.dumps(summary, indent=2, ensure_ascii=False))
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     return summary
 
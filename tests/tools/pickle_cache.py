@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+On-disk pickle cache for parsed CSV data.
+
+The tool scripts re-parse the same vocabulary and radical CSVs on every run.
+load_cached() stores each loader's result under tests/tools/.cache, keyed by
+the source file's path, mtime and size plus the loader and its arguments, so
+unchanged files are unpickled instead of parsed. Editing a CSV changes its
+key; editing a loader's code does not, so clear .cache after changing one.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / '.cache'
+
+
+def load_cached(path, loader, *args):
+    """
+    Return loader(path, *args), reusing a pickled result while path is unchanged.
+
+    Args:
+        path: Source file the loader reads
+        loader: Module-level function called as loader(path, *args)
+        args: Extra hashable arguments passed to loader (part of the key)
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key_source = (path, st.st_mtime_ns, st.st_size, loader.__module__, loader.__qualname__, args)
+    key = hashlib.sha1(repr(key_source).encode('utf-8')).hexdigest()
+    cache_file = CACHE_DIR / f'{key}.pkl'
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+
+    result = loader(path, *args)
+
+    # Write to a temp file first so a concurrent run never reads a partial pickle
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return result
@@ -3,9 +3,12 @@
 
 import csv
 
+from build_radicals_from_vocab import discover_csvs
+
 # Load radicals
 radicals = set()
-with open('data/languages/chinese/radicals/radicals.csv', 'r', encoding='utf-8') as f:
+radicals_entry = discover_csvs('data/languages/chinese/radicals', ['radicals.csv'])['radicals.csv']
+with open(radicals_entry.path, 'r', encoding='utf-8') as f:
     reader = csv.DictReader(f)
     for row in reader:
         radicals.add(row['Radical'])
@@ -13,19 +16,18 @@ with open('data/languages/chinese/radicals/radicals.csv', 'r', encoding='utf-8')
 print('Total radicals loaded: {}'.format(len(radicals)))
 
 # Check each level
-for level in ['basic', 'intermediate', 'advanced']:
-    filepath = 'data/languages/chinese/{}.csv'.format(level)
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        level_words = set()
-        level_chars = set()
-        for row in reader:
-            word = row['Word']
-            level_words.add(word)
-            for c in word:
-                level_chars.add(c)
+levels = ['basic', 'intermediate', 'advanced']
+level_files = discover_csvs('data/languages/chinese', ['{}.csv'.format(level) for level in levels])
+for level in levels:
+    with open(level_files['{}.csv'.format(level)].path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        word_idx = next(reader).index('Word')
+        words = [row[word_idx] for row in reader]
+    level_words = set(words)
+    # One set() over the concatenated words instead of a per-row update
+    level_chars = set(''.join(words))
     
-    level_radicals = sorted([c for c in level_chars if c in radicals])
+    level_radicals = sorted(level_chars & radicals)
     print('\n{} level:'.format(level.upper()))
     print('  Total words: {}'.format(len(level_words)))
     print('  Unique characters in words: {}'.format(len(level_chars)))
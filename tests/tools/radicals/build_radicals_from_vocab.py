@@ -14,7 +14,9 @@ The generated radicals.csv is a subset tailored to this vocabulary set.
 
 import csv
 import os
-from collections import defaultdict
+import re
+from collections import Counter
+from operator import itemgetter
 
 # Traditional character mappings for simplified radicals
 # Format: simplified -> (traditional, notes)
@@ -263,23 +265,56 @@ COMMON_COMPONENTS = {
 def get_script_dir():
     return os.path.dirname(os.path.abspath(__file__))
 
+# One radical token from the '+'-separated Radicals column, surrounding spaces excluded
+_TOKEN = re.compile(r'[^+\s]+')
+
+# path -> (mtime_ns, size, rows); lets repeated loads in one process skip the parse
+_csv_cache = {}
+
+def discover_csvs(vocab_dir, names):
+    """Map each of names present in vocab_dir to its os.DirEntry, from one directory scan."""
+    wanted = set(names)
+    try:
+        with os.scandir(vocab_dir) as it:
+            return {e.name: e for e in it if e.name in wanted and e.is_file()}
+    except FileNotFoundError:
+        return {}
+
+def read_csv_rows(path):
+    """Read a CSV as a list of row dicts, cached until the file's mtime or size changes.
+    Accepts a path or an os.DirEntry from discover_csvs (whose stat is cached).
+
+    The returned rows are shared between callers and must not be modified.
+    """
+    if isinstance(path, os.DirEntry):
+        st = path.stat()
+        path = path.path
+    else:
+        st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _csv_cache.get(path)
+    if hit and hit[:2] == key:
+        return hit[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    _csv_cache[path] = (*key, rows)
+    return rows
+
 def load_radicals_214(base_dir):
     """Load the official 214 Kangxi radicals."""
     path = os.path.join(base_dir, 'data', 'languages', 'chinese', 'radicals', 'radicals_214.csv')
     radicals = {}
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rad = row['Radical']
-            # Handle duplicates (like 斗) by keeping first occurrence
-            if rad not in radicals:
-                radicals[rad] = {
-                    'Radical': rad,
-                    'Pinyin': row['Pinyin'],
-                    'Description': row['Description'],
-                    'Meaning': row['Meaning'],
-                    'Set': 'kangxi_214'
-                }
+    for row in read_csv_rows(path):
+        rad = row['Radical']
+        # Handle duplicates (like 斗) by keeping first occurrence
+        if rad not in radicals:
+            radicals[rad] = {
+                'Radical': rad,
+                'Pinyin': row['Pinyin'],
+                'Description': row['Description'],
+                'Meaning': row['Meaning'],
+                'Set': 'kangxi_214'
+            }
     print(f"Loaded {len(radicals)} unique radicals from radicals_214.csv")
     return radicals
 
@@ -289,115 +324,153 @@ def extract_radicals_from_vocab(base_dir):
     vocab_dir = os.path.join(base_dir, 'data', 'languages', 'chinese')
     levels = ['basic', 'intermediate', 'advanced']
     
-    radical_usage = defaultdict(lambda: {'count': 0, 'levels': set(), 'words': []})
+    radical_counts = Counter()
+    radical_levels = {}
+    radical_examples = {}
     vocab_lookup = {}
     
+    csv_files = discover_csvs(vocab_dir, [f'{level}.csv' for level in levels])
+    
     for level in levels:
-        filepath = os.path.join(vocab_dir, f'{level}.csv')
-        if not os.path.exists(filepath):
-            print(f"Warning: {filepath} not found")
+        entry = csv_files.get(f'{level}.csv')
+        if entry is None:
+            print(f"Warning: {os.path.join(vocab_dir, f'{level}.csv')} not found")
             continue
             
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                word = row.get('Word', '')
-                pinyin = row.get('Pinyin', '')
-                english = row.get('English', '')
-                radicals_str = row.get('Radicals', '')
-                
-                # Store vocab info for lookup
-                if word and word not in vocab_lookup:
-                    vocab_lookup[word] = {'Pinyin': pinyin, 'Meaning': english}
+        for row in read_csv_rows(entry):
+            word = row.get('Word', '')
+            pinyin = row.get('Pinyin', '')
+            english = row.get('English', '')
+            radicals_str = row.get('Radicals', '')
+            
+            # Store vocab info for lookup
+            if word and word not in vocab_lookup:
+                vocab_lookup[word] = {'Pinyin': pinyin, 'Meaning': english}
+            
+            if not radicals_str:
+                continue
                 
-                if not radicals_str:
+            # Split by '+' to get individual radicals
+            for rad in _TOKEN.findall(radicals_str):
+                radical_counts[rad] += 1
+                levels_seen = radical_levels.get(rad)
+                if levels_seen is None:
+                    # First sighting: create both containers at once
+                    radical_levels[rad] = {level}
+                    radical_examples[rad] = [word]
                     continue
-                    
-                # Split by '+' to get individual radicals
-                for rad in radicals_str.split('+'):
-                    rad = rad.strip()
-                    if rad:
-                        radical_usage[rad]['count'] += 1
-                        radical_usage[rad]['levels'].add(level)
-                        if len(radical_usage[rad]['words']) < 5:  # Keep first 5 example words
-                            radical_usage[rad]['words'].append(word)
+                levels_seen.add(level)
+                examples = radical_examples[rad]
+                if len(examples) < 5:  # Keep first 5 example words
+                    examples.append(word)
     
-    print(f"Found {len(radical_usage)} unique radical entries in vocabulary")
-    return dict(radical_usage), vocab_lookup
+    print(f"Found {len(radical_counts)} unique radical entries in vocabulary")
+    return radical_counts, radical_levels, radical_examples, vocab_lookup
 
-def build_custom_radicals(radicals_214, radical_usage, vocab_lookup):
-    """Build custom radicals list with metadata."""
-    custom_radicals = []
-    
-    for rad, usage in radical_usage.items():
-        # Try to find metadata from official 214
-        if rad in radicals_214:
-            entry = radicals_214[rad].copy()
-            entry['Levels'] = ','.join(sorted(usage['levels']))
-            entry['UsageCount'] = usage['count']
+def build_radical_meta(radicals_214, radicals, vocab_lookup):
+    """Resolve metadata for each radical once, in lookup priority order:
+    official 214, variant forms, vocabulary words, then common components."""
+    meta = {}
+    for rad, base in radicals_214.items():
+        meta[rad] = {
+            'Radical': rad,
+            'Pinyin': base['Pinyin'],
+            'Description': base['Description'],
+            'Meaning': base['Meaning'],
+            'Set': 'kangxi_214',
+            'MainRadical': '',
             # Add traditional form if different
-            if rad in TRADITIONAL_FORMS:
-                trad, note = TRADITIONAL_FORMS[rad]
-                entry['Traditional'] = trad
-            else:
-                entry['Traditional'] = rad
-        elif rad in VARIANT_TO_MAIN:
-            # It's a variant form - get metadata from main radical
-            main_rad = VARIANT_TO_MAIN[rad]
-            if main_rad in radicals_214:
-                base = radicals_214[main_rad]
-                entry = {
-                    'Radical': rad,
-                    'Pinyin': base['Pinyin'],
-                    'Description': f"{base['Description']} (variant form)",
-                    'Meaning': f"{base['Meaning']} (component form)",
-                    'Set': 'variant',
-                    'MainRadical': main_rad,
-                    'Levels': ','.join(sorted(usage['levels'])),
-                    'UsageCount': usage['count'],
-                    'Traditional': rad  # Variants are typically already simplified forms
-                }
-            else:
-                # Variant without 214 match
-                entry = {
-                    'Radical': rad,
-                    'Pinyin': '',
-                    'Description': f'variant of {main_rad}',
-                    'Meaning': 'component form',
-                    'Set': 'variant',
-                    'MainRadical': main_rad,
-                    'Levels': ','.join(sorted(usage['levels'])),
-                    'UsageCount': usage['count'],
-                    'Traditional': rad
-                }
+            'Traditional': TRADITIONAL_FORMS.get(rad, (rad,))[0]
+        }
+    
+    for rad, main_rad in VARIANT_TO_MAIN.items():
+        if rad in meta:
+            continue
+        # It's a variant form - get metadata from main radical
+        base = radicals_214.get(main_rad)
+        if base is not None:
+            meta[rad] = {
+                'Radical': rad,
+                'Pinyin': base['Pinyin'],
+                'Description': f"{base['Description']} (variant form)",
+                'Meaning': f"{base['Meaning']} (component form)",
+                'Set': 'variant',
+                'MainRadical': main_rad,
+                'Traditional': rad  # Variants are typically already simplified forms
+            }
         else:
-            # Not in 214 and not a known variant - might be a word component
-            
-            # Try to find in vocab_lookup
-            pinyin = ''
-            description = 'word component'
-            meaning = 'character component (not official radical)'
-            
-            if rad in vocab_lookup:
-                pinyin = vocab_lookup[rad]['Pinyin']
-                meaning = vocab_lookup[rad]['Meaning']
-                description = 'character component (also a word)'
-            elif rad in COMMON_COMPONENTS:
-                pinyin, meaning_text = COMMON_COMPONENTS[rad]
-                meaning = meaning_text
-                description = 'common character component'
-            
-            entry = {
+            # Variant without 214 match
+            meta[rad] = {
+                'Radical': rad,
+                'Pinyin': '',
+                'Description': f'variant of {main_rad}',
+                'Meaning': 'component form',
+                'Set': 'variant',
+                'MainRadical': main_rad,
+                'Traditional': rad
+            }
+    
+    # Not in 214 and not a known variant - might be a word component
+    for rad in radicals:
+        if rad in meta:
+            continue
+        vocab = vocab_lookup.get(rad)
+        if vocab is not None:
+            meta[rad] = {
+                'Radical': rad,
+                'Pinyin': vocab['Pinyin'],
+                'Description': 'character component (also a word)',
+                'Meaning': vocab['Meaning'],
+                'Set': 'component',
+                'MainRadical': '',
+                'Traditional': rad
+            }
+    
+    for rad, (pinyin, meaning) in COMMON_COMPONENTS.items():
+        if rad not in meta:
+            meta[rad] = {
                 'Radical': rad,
                 'Pinyin': pinyin,
-                'Description': description,
+                'Description': 'common character component',
                 'Meaning': meaning,
                 'Set': 'component',
-                'Levels': ','.join(sorted(usage['levels'])),
-                'UsageCount': usage['count'],
+                'MainRadical': '',
                 'Traditional': rad
             }
-        
+    
+    return meta
+
+def make_unknown(rad):
+    """Metadata for a component with no known source."""
+    return {
+        'Radical': rad,
+        'Pinyin': '',
+        'Description': 'word component',
+        'Meaning': 'character component (not official radical)',
+        'Set': 'component',
+        'MainRadical': '',
+        'Traditional': rad
+    }
+
+# frozenset(levels) -> 'basic,intermediate'; at most 7 distinct level combinations
+_levels_cache = {}
+
+def join_levels(levels):
+    """Comma-joined sorted level names, memoized per level set."""
+    key = frozenset(levels)
+    joined = _levels_cache.get(key)
+    if joined is None:
+        joined = _levels_cache[key] = ','.join(sorted(key))
+    return joined
+
+def build_custom_radicals(radicals_214, radical_counts, radical_levels, vocab_lookup):
+    """Build custom radicals list with metadata."""
+    meta = build_radical_meta(radicals_214, radical_counts, vocab_lookup)
+    custom_radicals = []
+    
+    for rad, count in radical_counts.items():
+        entry = meta.get(rad) or make_unknown(rad)
+        entry.update(Levels=join_levels(radical_levels[rad]), UsageCount=count)
         custom_radicals.append(entry)
     
     return custom_radicals
@@ -411,11 +484,13 @@ def write_radicals_csv(radicals, output_path):
     """Write the radicals to CSV."""
     fieldnames = ['Radical', 'Pinyin', 'Description', 'Meaning', 'Set', 'Traditional', 'Levels', 'UsageCount', 'MainRadical']
     
+    # Every entry carries all of these keys, so rows can be fetched positionally
+    getter = itemgetter(*fieldnames)
+    
     with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for rad in radicals:
-            writer.writerow(rad)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(map(getter, radicals))
     
     print(f"Written {len(radicals)} radicals to {output_path}")
 
@@ -436,7 +511,8 @@ def print_summary(radicals):
         for c in sorted(components, key=lambda x: -x.get('UsageCount', 0))[:20]:
             print(f"  {c['Radical']} (used {c.get('UsageCount', 0)} times in {c.get('Levels', '')})")
 
-def main():
+def main(return_list=False):
+    """Rebuild radicals.csv; with return_list=True also return the written entries."""
     script_dir = get_script_dir()
     base_dir = os.path.dirname(script_dir)
     
@@ -447,10 +523,10 @@ def main():
     radicals_214 = load_radicals_214(base_dir)
     
     # Extract radicals from vocabulary
-    radical_usage, vocab_lookup = extract_radicals_from_vocab(base_dir)
+    radical_counts, radical_levels, _, vocab_lookup = extract_radicals_from_vocab(base_dir)
     
     # Build custom radicals list with metadata
-    custom_radicals = build_custom_radicals(radicals_214, radical_usage, vocab_lookup)
+    custom_radicals = build_custom_radicals(radicals_214, radical_counts, radical_levels, vocab_lookup)
     
     # Sort
     sorted_radicals = sort_radicals(custom_radicals)
@@ -463,6 +539,9 @@ def main():
     print_summary(sorted_radicals)
     
     print("\nDone! radicals_214.csv remains unchanged as official reference.")
+    
+    if return_list:
+        return sorted_radicals
 
 if __name__ == '__main__':
     main()
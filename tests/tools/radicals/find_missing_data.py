@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Find radicals with missing data in radicals.csv and rebuild"""
-import csv
 import os
 import sys
 
@@ -12,21 +11,15 @@ sys.path.insert(0, os.path.join(base_dir, 'tools'))
 from build_radicals_from_vocab import main as build_main
 
 print("Rebuilding radicals.csv...")
-build_main()
-
-# Load radicals.csv and find entries with empty Pinyin
-radicals_path = os.path.join(base_dir, 'data', 'languages', 'chinese', 'radicals', 'radicals.csv')
+# Check the freshly built entries directly instead of re-reading radicals.csv
+radicals = build_main(return_list=True)
 
 print('\n=== Checking for radicals still missing Pinyin ===')
-with open(radicals_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    missing = []
-    for row in reader:
-        if not row.get('Pinyin', '').strip():
-            missing.append(row)
-            print(f"  {row['Radical']} - {row['Description']} - Levels: {row['Levels']}")
-    
-    if missing:
-        print(f"\nTotal: {len(missing)} radicals still missing Pinyin data")
-    else:
-        print("\nAll radicals now have complete Pinyin data!")
+missing = [r for r in radicals if not r.get('Pinyin', '').strip()]
+for row in missing:
+    print(f"  {row['Radical']} - {row['Description']} - Levels: {row['Levels']}")
+
+if missing:
+    print(f"\nTotal: {len(missing)} radicals still missing Pinyin data")
+else:
+    print("\nAll radicals now have complete Pinyin data!")
@@ -7,68 +7,115 @@ Tests that:
 """
 import csv
 import os
+import sys
+from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-# Set working directory
-os.chdir('D:/teach/LANGUAGES/chinese/100-Janulus-matrix/chinese-matrix-lenguage-learn/web_v3')
+# Shared helpers live in tests/tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pickle_cache import load_cached
 
-def load_radicals_csv():
-    """Load radicals from radicals.csv"""
+# Project root; paths are absolute so importing this module has no side effects
+BASE = Path('D:/teach/LANGUAGES/chinese/100-Janulus-matrix/chinese-matrix-lenguage-learn/web_v3')
+
+LEVELS = ['basic', 'intermediate', 'advanced']
+
+def _parse_radicals_csv(path):
     radicals = {}
-    with open('data/languages/chinese/radicals/radicals.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        # Positional rows: fixed schema, no per-row dict
+        reader = csv.reader(f)
+        header = next(reader)
+        radical_i, pinyin_i, description_i, meaning_i = (
+            header.index(c) for c in ('Radical', 'Pinyin', 'Description', 'Meaning'))
         for row in reader:
-            radicals[row['Radical']] = {
-                'pinyin': row.get('Pinyin', ''),
-                'description': row.get('Description', ''),
-                'meaning': row.get('Meaning', '')
+            if not row:
+                continue
+            radicals[row[radical_i]] = {
+                'pinyin': row[pinyin_i],
+                'description': row[description_i],
+                'meaning': row[meaning_i]
             }
     return radicals
 
-def load_level_vocabulary(level):
-    """Load vocabulary from a level CSV"""
+@lru_cache(maxsize=None)
+def load_radicals_csv():
+    """Load radicals from radicals.csv (parsed once per run; do not modify the result)"""
+    return load_cached(BASE / 'data/languages/chinese/radicals/radicals.csv', _parse_radicals_csv)
+
+def _parse_level_vocabulary(path, level):
     words = {}
-    filepath = f'data/languages/chinese/{level}.csv'
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        # Positional rows: fixed schema, no per-row dict
+        reader = csv.reader(f)
+        header = next(reader)
+        word_i, pinyin_i, english_i, radicals_i = (
+            header.index(c) for c in ('Word', 'Pinyin', 'English', 'Radicals'))
         for row in reader:
-            word = row.get('Word', '')
-            radicals_str = row.get('Radicals', '')
-            radicals = [r.strip() for r in radicals_str.split('+') if r.strip()]
+            if not row:
+                continue
+            word = row[word_i]
+            radicals_str = row[radicals_i] if radicals_i < len(row) else ''
+            # Tuple: strip each token once, no list over-allocation
+            radicals = tuple(r for r in map(str.strip, radicals_str.split('+')) if r)
             words[word] = {
-                'pinyin': row.get('Pinyin', ''),
-                'english': row.get('English', ''),
+                'pinyin': row[pinyin_i],
+                'english': row[english_i],
                 'radicals': radicals,
+                'radicals_set': frozenset(radicals),
                 'level': level
             }
     return words
 
-def test_level_filtering():
+@lru_cache(maxsize=None)
+def load_level_vocabulary(level):
+    """Load vocabulary from a level CSV (parsed once per level; do not modify the result)"""
+    return load_cached(BASE / f'data/languages/chinese/{level}.csv', _parse_level_vocabulary, level)
+
+def load_all_level_vocabularies():
+    """Load every level's vocabulary once, keyed by level name"""
+    with ThreadPoolExecutor(max_workers=len(LEVELS)) as executor:
+        return dict(zip(LEVELS, executor.map(load_level_vocabulary, LEVELS)))
+
+@lru_cache(maxsize=None)
+def all_levels_vocab():
+    """Every level's vocabulary merged, first level wins (built once; do not modify the result)"""
+    merged = {}
+    for level in LEVELS:
+        for word, data in load_level_vocabulary(level).items():
+            merged.setdefault(word, data)
+    return merged
+
+def test_level_filtering(level_vocabs=None):
     """Test that each level only shows its own words and radicals"""
+    if level_vocabs is None:
+        level_vocabs = load_all_level_vocabularies()
     print("\n" + "=" * 60)
     print("TEST: LEVEL FILTERING")
     print("=" * 60)
     
     radicals_csv = load_radicals_csv()
+    radicals_keys = frozenset(radicals_csv)
     all_levels = ['basic', 'intermediate', 'advanced']
     
     for level in all_levels:
-        level_vocab = load_level_vocabulary(level)
+        level_vocab = level_vocabs[level]
         level_radicals = set()
+        add_radicals = level_radicals.update
         composable_count = 0
         
-        for word, data in level_vocab.items():
-            for r in data['radicals']:
-                level_radicals.add(r)
+        for data in level_vocab.values():
+            radicals_set = data['radicals_set']
+            add_radicals(radicals_set)
             
             # Check composable words (2+ radicals, all in radicals.csv)
-            if len(data['radicals']) >= 2:
-                all_exist = all(r in radicals_csv for r in data['radicals'])
-                if all_exist:
-                    composable_count += 1
+            if len(data['radicals']) >= 2 and radicals_set <= radicals_keys:
+                composable_count += 1
         
         # Verify all radicals exist in radicals.csv
-        missing = [r for r in level_radicals if r not in radicals_csv]
+        missing = level_radicals - radicals_keys
         
         print(f"\n{level.upper()} LEVEL:")
         print(f"  Words: {len(level_vocab)}")
@@ -76,29 +123,29 @@ def test_level_filtering():
         print(f"  Composable words (2+ radicals): {composable_count}")
         print(f"  Missing radicals: {len(missing)} {'⚠' if missing else '✓'}")
         if missing:
-            print(f"    {missing[:10]}")
+            print(f"    {list(missing)[:10]}")
 
-def test_all_levels_mode():
+def test_all_levels_mode(level_vocabs=None):
     """Test that 'all_levels' mode correctly combines all levels"""
+    if level_vocabs is None:
+        level_vocabs = load_all_level_vocabularies()
     print("\n" + "=" * 60)
     print("TEST: ALL_LEVELS MODE")
     print("=" * 60)
     
     radicals_csv = load_radicals_csv()
-    all_words = {}
+    radicals_keys = frozenset(radicals_csv)
+    all_words = all_levels_vocab()
     all_radicals = set()
     
+    # Radicals of repeated words count from every level, not just the first
     for level in ['basic', 'intermediate', 'advanced']:
-        level_vocab = load_level_vocabulary(level)
-        for word, data in level_vocab.items():
-            if word not in all_words:
-                all_words[word] = data
-            for r in data['radicals']:
-                all_radicals.add(r)
+        for data in level_vocabs[level].values():
+            all_radicals.update(data['radicals_set'])
     
     # Count composable words
     composable = [w for w, d in all_words.items() 
-                  if len(d['radicals']) >= 2 and all(r in radicals_csv for r in d['radicals'])]
+                  if len(d['radicals']) >= 2 and d['radicals_set'] <= radicals_keys]
     
     print(f"\nALL LEVELS COMBINED:")
     print(f"  Total unique words: {len(all_words)}")
@@ -112,23 +159,24 @@ def test_all_levels_mode():
         d = all_words[word]
         print(f"  {word} ({d['pinyin']}) = {' + '.join(d['radicals'])} [{d['level']}]")
 
-def test_word_composer_requirements():
+def test_word_composer_requirements(level_vocabs=None):
     """Test that WordComposer will have valid data"""
+    if level_vocabs is None:
+        level_vocabs = load_all_level_vocabularies()
     print("\n" + "=" * 60)
     print("TEST: WORD COMPOSER REQUIREMENTS")
     print("=" * 60)
     
     radicals_csv = load_radicals_csv()
+    radicals_keys = frozenset(radicals_csv)
     
     for level in ['basic', 'intermediate', 'advanced', 'all_levels']:
         print(f"\n{level.upper()}:")
         
         if level == 'all_levels':
-            vocab = {}
-            for l in ['basic', 'intermediate', 'advanced']:
-                vocab.update(load_level_vocabulary(l))
+            vocab = all_levels_vocab()
         else:
-            vocab = load_level_vocabulary(level)
+            vocab = level_vocabs[level]
         
         # WordComposer requirements:
         # 1. Word must have 2+ radicals
@@ -139,10 +187,10 @@ def test_word_composer_requirements():
         
         for word, data in vocab.items():
             if len(data['radicals']) >= 2:
-                missing = [r for r in data['radicals'] if r not in radicals_csv]
-                if not missing:
+                if data['radicals_set'] <= radicals_keys:
                     valid_words.append(word)
                 else:
+                    missing = [r for r in data['radicals'] if r not in radicals_keys]
                     invalid_words.append((word, missing))
         
         print(f"  Valid for WordComposer: {len(valid_words)}")
@@ -153,23 +201,26 @@ def test_word_composer_requirements():
             for w, missing in invalid_words[:3]:
                 print(f"    '{w}' missing: {missing}")
 
-def test_radical_reference_section():
+def test_radical_reference_section(level_vocabs=None):
     """Test what radicals should appear in the radical reference section per level"""
+    if level_vocabs is None:
+        level_vocabs = load_all_level_vocabularies()
     print("\n" + "=" * 60)
     print("TEST: RADICAL REFERENCE SECTION")
     print("=" * 60)
     
     radicals_csv = load_radicals_csv()
+    radicals_keys = frozenset(radicals_csv)
     
     for level in ['basic', 'intermediate', 'advanced']:
-        vocab = load_level_vocabulary(level)
+        vocab = level_vocabs[level]
         
         # Collect radicals used in this level's words
         # Only include radicals that exist in radicals.csv
         level_radicals = set()
         for word, data in vocab.items():
             for r in data['radicals']:
-                if r in radicals_csv:
+                if r in radicals_keys:
                     level_radicals.add(r)
         
         print(f"\n{level.upper()} LEVEL:")
@@ -181,10 +232,11 @@ def main():
     print("INTEGRATION TEST: WORD-RADICAL RELATIONSHIPS")
     print("=" * 60)
     
-    test_level_filtering()
-    test_all_levels_mode()
-    test_word_composer_requirements()
-    test_radical_reference_section()
+    level_vocabs = load_all_level_vocabularies()
+    test_level_filtering(level_vocabs)
+    test_all_levels_mode(level_vocabs)
+    test_word_composer_requirements(level_vocabs)
+    test_radical_reference_section(level_vocabs)
     
     print("\n" + "=" * 60)
     print("ALL TESTS COMPLETE")
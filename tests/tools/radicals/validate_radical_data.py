@@ -7,43 +7,69 @@ Checks that:
 """
 import csv
 import os
-from collections import defaultdict
+import sys
+from pathlib import Path
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-# Set working directory
-os.chdir('D:/teach/LANGUAGES/chinese/100-Janulus-matrix/chinese-matrix-lenguage-learn/web_v3')
+# Shared helpers live in tests/tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pickle_cache import load_cached
 
-def load_radicals():
-    """Load all radicals from radicals.csv"""
+# Project root; paths are absolute so importing this module has no side effects
+BASE = Path('D:/teach/LANGUAGES/chinese/100-Janulus-matrix/chinese-matrix-lenguage-learn/web_v3')
+
+def _parse_radicals(path):
     radicals = {}
-    with open('data/languages/chinese/radicals/radicals.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        # Positional rows: fixed schema, no per-row dict
+        reader = csv.reader(f)
+        header = next(reader)
+        radical_i, pinyin_i, description_i, meaning_i = (
+            header.index(c) for c in ('Radical', 'Pinyin', 'Description', 'Meaning'))
         for row in reader:
-            radicals[row['Radical']] = {
-                'pinyin': row.get('Pinyin', ''),
-                'description': row.get('Description', ''),
-                'meaning': row.get('Meaning', '')
+            if not row:
+                continue
+            radicals[row[radical_i]] = {
+                'pinyin': row[pinyin_i],
+                'description': row[description_i],
+                'meaning': row[meaning_i]
             }
     return radicals
 
-def load_vocabulary(level):
-    """Load vocabulary from a level CSV"""
+def load_radicals():
+    """Load all radicals from radicals.csv"""
+    return load_cached(BASE / 'data/languages/chinese/radicals/radicals.csv', _parse_radicals)
+
+def _parse_vocabulary(path, level):
     words = []
-    filepath = f'data/languages/chinese/{level}.csv'
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        # Positional rows: fixed schema, no per-row dict
+        reader = csv.reader(f)
+        header = next(reader)
+        word_i, pinyin_i, english_i, radicals_i = (
+            header.index(c) for c in ('Word', 'Pinyin', 'English', 'Radicals'))
         for row in reader:
-            word = row.get('Word', '')
-            radicals_str = row.get('Radicals', '')
-            radicals = [r.strip() for r in radicals_str.split('+') if r.strip()]
+            if not row:
+                continue
+            word = row[word_i]
+            radicals_str = row[radicals_i] if radicals_i < len(row) else ''
+            # Tuple: strip each token once, no list over-allocation
+            radicals = tuple(r for r in map(str.strip, radicals_str.split('+')) if r)
             words.append({
                 'word': word,
-                'pinyin': row.get('Pinyin', ''),
-                'english': row.get('English', ''),
+                'pinyin': row[pinyin_i],
+                'english': row[english_i],
                 'radicals': radicals,
+                'radicals_set': frozenset(radicals),
                 'level': level
             })
     return words
 
+def load_vocabulary(level):
+    """Load vocabulary from a level CSV"""
+    return load_cached(BASE / f'data/languages/chinese/{level}.csv', _parse_vocabulary, level)
+
 def main():
     print("=" * 60)
     print("RADICAL AND VOCABULARY DATA VALIDATION")
@@ -55,8 +81,11 @@ def main():
     
     # Load all vocabulary
     all_words = []
-    for level in ['basic', 'intermediate', 'advanced']:
-        words = load_vocabulary(level)
+    levels = ['basic', 'intermediate', 'advanced']
+    # Levels are independent files; read them concurrently, report in order
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        level_words = list(executor.map(load_vocabulary, levels))
+    for level, words in zip(levels, level_words):
         all_words.extend(words)
         print(f"✓ Loaded {len(words)} words from {level}.csv")
     
@@ -67,14 +96,19 @@ def main():
     print("RADICAL COVERAGE CHECK")
     print("-" * 60)
     
+    radicals_keys = frozenset(radicals)
     used_radicals = set()
     missing_radicals = defaultdict(list)
     
+    # One pass per word: set union for coverage, one subset test reused below
     for word_data in all_words:
-        for radical in word_data['radicals']:
-            used_radicals.add(radical)
-            if radical not in radicals:
-                missing_radicals[radical].append(word_data['word'])
+        rset = word_data['radicals_set']
+        used_radicals |= rset
+        word_data['all_radicals_exist'] = all_exist = rset <= radicals_keys
+        if not all_exist:
+            for radical in word_data['radicals']:
+                if radical not in radicals_keys:
+                    missing_radicals[radical].append(word_data['word'])
     
     print(f"\nRadicals in vocabulary CSVs: {len(used_radicals)}")
     print(f"Radicals in radicals.csv: {len(radicals)}")
@@ -93,17 +127,12 @@ def main():
     print("WORD COMPOSITION STATS")
     print("-" * 60)
     
-    composition_counts = defaultdict(int)
-    composable_words = []
-    
-    for word_data in all_words:
-        count = len(word_data['radicals'])
-        composition_counts[count] += 1
-        if count >= 2:
-            # Check if all radicals exist in radicals.csv
-            all_radicals_exist = all(r in radicals for r in word_data['radicals'])
-            if all_radicals_exist:
-                composable_words.append(word_data)
+    composition_counts = Counter(len(word_data['radicals']) for word_data in all_words)
+    # Composable: 2+ radicals, all of them in radicals.csv
+    composable_words = [
+        word_data for word_data in all_words
+        if len(word_data['radicals']) >= 2 and word_data['all_radicals_exist']
+    ]
     
     print("\nWords by radical count:")
     for count in sorted(composition_counts.keys()):
@@ -122,11 +151,16 @@ def main():
     print("DUPLICATE CHECK")
     print("-" * 60)
     
-    word_counts = defaultdict(list)
+    # Only repeated words get a levels list; unique words cost one dict entry
+    seen = {}
+    duplicates = {}
     for word_data in all_words:
-        word_counts[word_data['word']].append(word_data['level'])
-    
-    duplicates = {w: levels for w, levels in word_counts.items() if len(levels) > 1}
+        word, level = word_data['word'], word_data['level']
+        first_level = seen.get(word)
+        if first_level is None:
+            seen[word] = level
+        else:
+            duplicates.setdefault(word, [first_level]).append(level)
     if duplicates:
         print(f"\n⚠ {len(duplicates)} words appear in multiple levels:")
         for word, levels in list(duplicates.items())[:10]:
@@ -27,11 +27,12 @@ def main():
     # Check 1: radicals_214.csv exists and has 214 unique entries
     print("\n[1] Checking radicals_214.csv (official reference)...")
     path_214 = os.path.join(radicals_dir, 'radicals_214.csv')
-    if not os.path.exists(path_214):
-        errors.append("radicals_214.csv not found!")
-    else:
+    try:
         with open(path_214, 'r', encoding='utf-8') as f:
             rows = list(csv.DictReader(f))
+    except FileNotFoundError:
+        errors.append("radicals_214.csv not found!")
+    else:
         unique = len(set(r['Radical'] for r in rows))
         print(f"   Total entries: {len(rows)}, Unique radicals: {unique}")
         if len(rows) != 214:
@@ -44,12 +45,13 @@ def main():
     # Check 2: radicals.csv exists and has proper structure
     print("\n[2] Checking radicals.csv (vocabulary-derived)...")
     path_radicals = os.path.join(radicals_dir, 'radicals.csv')
-    if not os.path.exists(path_radicals):
+    radical_rows = []
+    try:
+        with open(path_radicals, 'r', encoding='utf-8') as f:
+            rows = radical_rows = list(csv.DictReader(f))
+    except FileNotFoundError:
         errors.append("radicals.csv not found!")
     else:
-        with open(path_radicals, 'r', encoding='utf-8') as f:
-            rows = list(csv.DictReader(f))
-        
         # Check required columns
         required_cols = ['Radical', 'Pinyin', 'Set', 'Levels']
         if rows:
@@ -77,15 +79,20 @@ def main():
     # Check 3: Each vocabulary level has matching radicals in radicals.csv
     print("\n[3] Checking vocabulary-radicals alignment...")
     
-    # Load radicals map
-    radicals_map = {}
-    with open(path_radicals, 'r', encoding='utf-8') as f:
-        for row in csv.DictReader(f):
-            radicals_map[row['Radical']] = row
+    # Radicals map from the rows already loaded in check 2
+    radicals_map = {row['Radical']: row for row in radical_rows}
+    radicals_keys = frozenset(radicals_map)
     
     for level in ['basic', 'intermediate', 'advanced']:
         level_path = os.path.join(chinese_dir, f'{level}.csv')
-        if not os.path.exists(level_path):
+        # Parse the level once into (word, radicals) pairs for every check below
+        try:
+            with open(level_path, 'r', encoding='utf-8') as f:
+                level_words = [
+                    (row.get('Word') or '', [r for r in map(str.strip, (row.get('Radicals') or '').split('+')) if r])
+                    for row in csv.DictReader(f)
+                ]
+        except FileNotFoundError:
             warnings.append(f"{level}.csv not found")
             continue
         
@@ -93,20 +100,13 @@ def main():
         wrong_level_radicals = set()
         total_radicals = 0
         
-        with open(level_path, 'r', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                radicals_str = row.get('Radicals', '')
-                if not radicals_str:
-                    continue
-                for rad in radicals_str.split('+'):
-                    rad = rad.strip()
-                    if not rad:
-                        continue
-                    total_radicals += 1
-                    if rad not in radicals_map:
-                        missing_radicals.add(rad)
-                    elif level not in radicals_map[rad].get('Levels', ''):
-                        wrong_level_radicals.add(rad)
+        for word, radicals in level_words:
+            for rad in radicals:
+                total_radicals += 1
+                if rad not in radicals_keys:
+                    missing_radicals.add(rad)
+                elif level not in radicals_map[rad].get('Levels', ''):
+                    wrong_level_radicals.add(rad)
         
         if missing_radicals:
             errors.append(f"{level}: {len(missing_radicals)} radicals not in radicals.csv: {list(missing_radicals)[:5]}...")
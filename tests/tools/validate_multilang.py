@@ -14,6 +14,7 @@ import os
 import sys
 import json
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -47,12 +48,12 @@ EXPECTED_LANGUAGES = {
 def load_matrix_index():
     """Load and parse matrix_index.json"""
     index_path = DATA_DIR / "matrix_index.json"
-    if not index_path.exists():
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
         print(f"❌ matrix_index.json not found at {index_path}")
         return None
-    
-    with open(index_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
 
 
 def validate_matrix_index(matrix_index):
@@ -92,51 +93,81 @@ def validate_matrix_index(matrix_index):
     return errors
 
 
+def inspect_csv(csv_path, csv_columns):
+    """
+    Check one vocabulary CSV's header and count its rows.
+
+    Returns (errors, row_count); row_count is None when the file can't be read.
+    """
+    errors = []
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            headers = next(reader, None)
+            
+            # Check required columns
+            if headers is not None:
+                missing_cols = set(csv_columns).difference(headers)
+                # Report in config order so the output is stable
+                errors.extend(
+                    f"{csv_path.name}: missing column '{required_col}'"
+                    for required_col in csv_columns if required_col in missing_cols
+                )
+            
+            # Count records without keeping them (blank lines are skipped, as DictReader does)
+            return errors, sum(1 for row in reader if row)
+            
+    except FileNotFoundError:
+        errors.append(f"Missing CSV: {csv_path}")
+    except Exception as e:
+        errors.append(f"Error reading {csv_path}: {e}")
+    return errors, None
+
+
 def validate_csv_files():
     """Validate CSV files exist and have correct structure"""
     print("\n📁 Validating CSV files...")
     errors = []
     word_counts = {}
     
+    # Files are independent and I/O-bound, so inspect them concurrently
+    missing_dirs = {}
+    csv_jobs = []
     for lang, config in EXPECTED_LANGUAGES.items():
         lang_dir = DATA_DIR / "languages" / lang
         if not lang_dir.exists():
-            errors.append(f"Missing language directory: {lang_dir}")
+            missing_dirs[lang] = lang_dir
+            continue
+        for level in config["levels"]:
+            csv_jobs.append((lang, level, lang_dir / f"{level}.csv", config["csv_columns"]))
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = executor.map(inspect_csv, [job[2] for job in csv_jobs], [job[3] for job in csv_jobs])
+        inspected = {(lang, level): result for (lang, level, _, _), result in zip(csv_jobs, results)}
+    
+    # Report in language/level order, as the sequential loop did
+    for lang, config in EXPECTED_LANGUAGES.items():
+        if lang in missing_dirs:
+            errors.append(f"Missing language directory: {missing_dirs[lang]}")
             continue
         
         word_counts[lang] = {}
         
         for level in config["levels"]:
-            csv_path = lang_dir / f"{level}.csv"
-            if not csv_path.exists():
-                errors.append(f"Missing CSV: {csv_path}")
-                continue
-            
-            try:
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-                    
-                    # Check required columns
-                    if rows:
-                        headers = rows[0].keys()
-                        for required_col in config["csv_columns"]:
-                            if required_col not in headers:
-                                errors.append(f"{csv_path.name}: missing column '{required_col}'")
-                    
-                    word_counts[lang][level] = len(rows)
-                    print(f"  ✓ {lang}/{level}.csv: {len(rows)} words")
-                    
-            except Exception as e:
-                errors.append(f"Error reading {csv_path}: {e}")
+            file_errors, row_count = inspected[(lang, level)]
+            errors.extend(file_errors)
+            if row_count is not None:
+                word_counts[lang][level] = row_count
+                print(f"  ✓ {lang}/{level}.csv: {row_count} words")
     
     return errors, word_counts
 
 
 def validate_audio_folders():
-    """Validate audio folder structure exists"""
+    """Validate audio folder structure exists and count mp3 files per (lang, level)"""
     print("\n🔊 Validating audio folder structure...")
     errors = []
+    audio_file_counts = {}
     
     for lang, config in EXPECTED_LANGUAGES.items():
         audio_path = AUDIO_DIR / config["audio_path_style"]
@@ -152,18 +183,18 @@ def validate_audio_folders():
                 errors.append(f"Missing audio level folder: {level_path}")
             else:
                 # Count audio files
-                audio_files = list(level_path.glob("*.mp3"))
-                print(f"    ✓ {level}/: {len(audio_files)} audio files")
+                audio_count = sum(1 for _ in level_path.glob("*.mp3"))
+                audio_file_counts[(lang, level)] = audio_count
+                print(f"    ✓ {level}/: {audio_count} audio files")
     
-    return errors
+    return errors, audio_file_counts
 
 
-def compute_audio_coverage(word_counts):
+def compute_audio_coverage(word_counts, audio_file_counts):
     """Compute audio coverage percentage for each language/level"""
     print("\n📊 Audio Coverage Report:")
     
     for lang, config in EXPECTED_LANGUAGES.items():
-        audio_path = AUDIO_DIR / config["audio_path_style"]
         print(f"\n  {lang.upper()}:")
         
         if lang not in word_counts:
@@ -171,14 +202,14 @@ def compute_audio_coverage(word_counts):
             continue
         
         for level in config["levels"]:
-            level_path = audio_path / level
-            audio_files = list(level_path.glob("*.mp3")) if level_path.exists() else []
+            # Counted by validate_audio_folders; missing folders count as 0
+            audio_count = audio_file_counts.get((lang, level), 0)
             
             total_words = word_counts.get(lang, {}).get(level, 0)
             if total_words > 0:
-                coverage = (len(audio_files) / total_words) * 100
+                coverage = (audio_count / total_words) * 100
                 status = "✓" if coverage >= 95 else "⚠" if coverage >= 50 else "✗"
-                print(f"    {status} {level}: {len(audio_files)}/{total_words} ({coverage:.1f}%)")
+                print(f"    {status} {level}: {audio_count}/{total_words} ({coverage:.1f}%)")
             else:
                 print(f"    - {level}: no vocabulary data")
 
@@ -204,11 +235,11 @@ def main():
     all_errors.extend(errors)
     
     # Validate audio folders
-    errors = validate_audio_folders()
+    errors, audio_file_counts = validate_audio_folders()
     all_errors.extend(errors)
     
     # Compute coverage
-    compute_audio_coverage(word_counts)
+    compute_audio_coverage(word_counts, audio_file_counts)
     
     # Summary
     print("\n" + "=" * 60)
@@ -1,19 +1,30 @@
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 def extract_hanzi_from_csv(file_path):
     """Extract Chinese characters (Hanzi) from the Word column of a CSV file."""
-    hanzi_list = []
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
+    with open(file_path, 'r', encoding='utf-8', buffering=1 << 20, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        if 'Word' not in header:
+            return []
+        word_idx = header.index('Word')
+        # Positional rows skip the per-row dict DictReader would build
+        hanzi_list = []
         for row in reader:
-            if 'Word' in row and row['Word'].strip():
-                hanzi_list.append(row['Word'].strip())
+            if len(row) > word_idx:
+                word = row[word_idx].strip()
+                if word:
+                    hanzi_list.append(word)
     return hanzi_list
 
-# Extract Hanzi from each level
-basic_hanzi = extract_hanzi_from_csv(r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_basic.csv')
-intermediate_hanzi = extract_hanzi_from_csv(r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_intermediate.csv')
-advanced_hanzi = extract_hanzi_from_csv(r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_advanced.csv')
+# Extract Hanzi from each level; the three files are independent, so read them concurrently
+with ThreadPoolExecutor(max_workers=3) as executor:
+    basic_hanzi, intermediate_hanzi, advanced_hanzi = executor.map(extract_hanzi_from_csv, [
+        r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_basic.csv',
+        r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_intermediate.csv',
+        r'd:\teach\LANGUAGES\chinese\100-Janulus-matrix\chinese-matrix-lenguage-learn\web_v3\data\chinese_advanced.csv',
+    ])
 
 print("=== BASIC LEVEL HANZI ===")
 print(f"Total words: {len(basic_hanzi)}")
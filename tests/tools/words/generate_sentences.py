@@ -1,10 +1,15 @@
 import csv
+import os
 import random
+import sys
 
-# Function to load the matrix from CSV
-def load_matrix(filename):
+# Shared helpers live in tests/tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pickle_cache import load_cached
+
+def _parse_matrix(filename):
     matrix = {}
-    with open(filename, 'r', encoding='utf-8') as f:
+    with open(filename, 'r', encoding='utf-8', buffering=1 << 20) as f:
         reader = csv.DictReader(f)
         for row in reader:
             category = row['Category']
@@ -13,6 +18,10 @@ def load_matrix(filename):
             matrix[category].append(row)
     return matrix
 
+# Function to load the matrix from CSV (pickled between runs while the file is unchanged)
+def load_matrix(filename):
+    return load_cached(filename, _parse_matrix)
+
 # Function to generate a simple sentence: Time + Subject + Verb + Object + Particle
 def generate_sentence(matrix):
     time = random.choice(matrix.get('Time', []))['Word'] if 'Time' in matrix else ''
@@ -23,20 +32,23 @@ def generate_sentence(matrix):
     sentence = f"{time} {subject} {verb} {obj}{particle}".strip()
     return sentence
 
+# Function to index matrix rows by word (first occurrence wins, as in a category scan)
+def build_word_index(matrix):
+    word_index = {}
+    for words in matrix.values():
+        for word in words:
+            word_index.setdefault(word['Word'], word)
+    return word_index
+
 # Function to create Janulus matrix for a sentence (simplified tokenization)
-def create_janulus_matrix(sentence, matrix_data):
+def create_janulus_matrix(sentence, matrix_data, word_index=None):
+    if word_index is None:
+        word_index = build_word_index(matrix_data)
     tokens = sentence.split()
     janulus_matrix = []
     for idx, token in enumerate(tokens, 1):
         # Find matching word in matrix
-        word_info = None
-        for category, words in matrix_data.items():
-            for word in words:
-                if word['Word'] == token:
-                    word_info = word
-                    break
-            if word_info:
-                break
+        word_info = word_index.get(token)
         if word_info:
             row = {
                 'idx': idx,
@@ -54,12 +66,13 @@ def create_janulus_matrix(sentence, matrix_data):
 if __name__ == "__main__":
     matrix_file = 'chinese_basic_grammar_matrix.csv'
     matrix = load_matrix(matrix_file)
+    word_index = build_word_index(matrix)
 
     # Generate 5 example sentences and their matrices
     for i in range(5):
         sentence = generate_sentence(matrix)
         print(f"Sentence {i+1}: {sentence}")
-        janulus = create_janulus_matrix(sentence, matrix)
+        janulus = create_janulus_matrix(sentence, matrix, word_index)
         print("Janulus Matrix:")
         print("| idx | token | pos | role | category | pinyin | english |")
         print("|-----|-------|-----|------|----------|--------|---------|")
@@ -1,5 +1,18 @@
+import argparse
 import csv
+import io
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from sys import intern
+
+try:
+    import pandas as pd
+except ImportError:
+    # Only needed for --backend pandas
+    pd = None
 
 # Define the input files and their corresponding levels
 files_and_levels = [
@@ -8,30 +21,216 @@ files_and_levels = [
     ('chinese_advanced.csv', 'Advanced')
 ]
 
+# Output order of the levels; unknown levels go last
+level_order = {'Basic': 1, 'Intermediate': 2, 'Advanced': 3}
+
 # Output file
 output_file = 'chinese_all_levels.csv'
 
-# Read and merge the CSVs
-merged_data = []
-for file, level in files_and_levels:
-    if os.path.exists(file):
-        with open(file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                row['Level'] = level
-                merged_data.append(row)
-
-# Sort the merged data: first by Level (Basic, Intermediate, Advanced), then by Category, then by Word
-level_order = {'Basic': 1, 'Intermediate': 2, 'Advanced': 3}
-merged_data.sort(key=lambda x: (level_order.get(x['Level'], 4), x['Category'], x['Word']))
-
-# Write to output CSV
-if merged_data:
-    fieldnames = ['Level', 'Category', 'Word', 'Pinyin', 'English', 'POS', 'Role', 'Common_Usage', 'Example_Phrase']
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(merged_data)
-    print(f"Merged CSV created: {output_file}")
-else:
-    print("No data to merge.")
\ No newline at end of file
+# Output columns; every column after Level is read from the input files
+fieldnames = ['Level', 'Category', 'Word', 'Pinyin', 'English', 'POS', 'Role', 'Common_Usage', 'Example_Phrase']
+
+# Characters that make csv.writer (QUOTE_MINIMAL) quote a field
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _escape(field):
+    """Quote a field exactly as csv.writer's default dialect does."""
+    if _NEEDS_QUOTING.search(field):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _make_row_formatter(width, plain_columns=()):
+    """
+    Compile a formatter for rows of exactly width fields.
+
+    Same result as ','.join(map(_escape, row)) + '\\r\\n', with the per-field
+    calls unrolled into one f-string. Columns in plain_columns are known to
+    need no quoting and are inserted as is.
+    """
+    fields = ','.join('{r[%d]}' % i if i in plain_columns else '{_escape(r[%d])}' % i
+                      for i in range(width))
+    namespace = {'_escape': _escape}
+    exec("def format_row(r):\n    return f'" + fields + "\\r\\n'\n", namespace)
+    return namespace['format_row']
+
+
+# Level (column 0) only ever holds a level name or the 'Level' header
+_format_row = _make_row_formatter(
+    len(fieldnames),
+    plain_columns=(0,) if not any(_NEEDS_QUOTING.search(level) for _, level in files_and_levels) else (),
+)
+
+
+def format_rows(rows):
+    """Encode rows as one block of CSV bytes (csv.writer's default dialect)."""
+    return ''.join(map(_format_row, rows)).encode('utf-8')
+
+
+def read_rows(path):
+    """
+    Parse a CSV file into (header, rows) lists of fields, with blank lines
+    dropped. header is None for an empty file.
+
+    The vocabulary CSVs are written without quoting, so the common case is a
+    plain str.split per line. Files with quotes or bare CRs go through
+    csv.reader, which handles quoted commas and newlines.
+    """
+    with open(path, 'rb') as f:
+        data = f.read().decode('utf-8')
+
+    data = data.replace('\r\n', '\n')
+    if '"' in data or '\r' in data:
+        rows = (row for row in csv.reader(io.StringIO(data, newline='')) if row)
+    else:
+        rows = (line.split(',') for line in data.split('\n') if line)
+    # Header split off the iterator, so the body is never copied by slicing
+    header = next(rows, None)
+    return header, list(rows)
+
+
+def process_level(path, level):
+    """
+    Return the output rows of one level file, sorted by Category, then Word.
+
+    Level is the leading sort key, so concatenating the sorted levels in
+    level_order gives the same order as one global sort.
+    """
+    if not os.path.exists(path):
+        return []
+
+    header, body = read_rows(path)
+    if header is None:
+        return []
+    cat_idx = header.index('Category')
+    word_idx = header.index('Word')
+    # Output column positions in this file; missing columns (None) and short
+    # rows are written empty, like DictWriter's restval
+    out_index = [header.index(name) if name in header else None for name in fieldnames[1:]]
+
+    # (category, word, seq) keys; seq keeps ties in input order. Categories
+    # repeat across many rows, so interned copies compare equal by identity
+    keys = [(intern(row[cat_idx]), row[word_idx], seq) for seq, row in enumerate(body)]
+
+    # Level files written by the other tools are usually already in
+    # (Category, Word) order; one linear check then skips the sort entirely
+    if any(b < a for a, b in zip(keys, islice(keys, 1, None))):
+        keys.sort()
+        body = [body[key[2]] for key in keys]
+
+    if None in out_index:
+        return [[level] + [row[i] if i is not None and i < len(row) else '' for i in out_index]
+                for row in body]
+
+    # Every output column is present: pick them in one C call and prepend Level
+    width = len(header)
+    for row in body:
+        if len(row) < width:
+            row += [''] * (width - len(row))
+    return [(level,) + picked for picked in map(itemgetter(*out_index), body)]
+
+
+def format_level(file_and_level):
+    """Encoded, sorted CSV block for one (file, level) pair (b'' if empty)."""
+    file, level = file_and_level
+    return format_rows(process_level(file, level))
+
+
+def write_merged(ordered, output_path=output_file):
+    """
+    Write the merged CSV from (file, level) pairs in output order.
+
+    This is the primary backend: standard library only, and the output is
+    byte-identical to the original DictReader/DictWriter merge.
+
+    Returns False (and writes nothing) when there are no rows.
+    """
+    # Levels are independent files: read, sort and encode them concurrently.
+    # Each level's rows are dropped once encoded into its block, and each
+    # block is released as soon as it has been written, in level order
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        blocks = filter(None, executor.map(format_level, ordered))
+        first = next(blocks, None)
+        if first is None:
+            return False
+
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(format_rows([fieldnames]))
+            f.write(first)
+            del first
+            for block in blocks:
+                f.write(block)
+    return True
+
+
+def write_merged_pandas(ordered, output_path=output_file):
+    """
+    pandas version of write_merged(): C parser, vectorized sort and to_csv.
+    Selected with --backend pandas; test_merge_csvs.py checks it against
+    write_merged() byte for byte.
+
+    Cells are read as literal strings (no NA conversion) and rows are written
+    with csv.writer's CRLF line ending, so the output matches write_merged().
+    """
+    # Ordered categorical: Level is stored as an int8 code, not a string per row
+    level_type = pd.CategoricalDtype(list(dict.fromkeys(level for _, level in ordered)), ordered=True)
+
+    output_columns = set(fieldnames[1:])
+
+    def read_level(file_and_level):
+        file, level = file_and_level
+        # index_col=False: a trailing comma on every row must not turn the first
+        # column into the index. usecols: fields past the header (a trailing
+        # comma on some rows) are dropped instead of failing to tokenize
+        df = pd.read_csv(file, dtype=str, keep_default_na=False, index_col=False,
+                         usecols=lambda name: name in output_columns, encoding='utf-8')
+        df = df.assign(Level=pd.Series(level, index=df.index, dtype=level_type))
+        # Each level is its own bucket: only (Category, Word) needs sorting.
+        # Stable sort keeps ties in input order
+        return df.sort_values(['Category', 'Word'], kind='mergesort')
+
+    # The C parser releases the GIL, so the level files are read concurrently;
+    # frames come back in level order, so concatenating them needs no re-sort
+    present = [item for item in ordered if os.path.exists(item[0])]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        frames = list(executor.map(read_level, present))
+
+    merged = pd.concat(frames, ignore_index=True) if frames else None
+    if merged is None or merged.empty:
+        return False
+
+    # Columns missing from an input are written empty, like the csv path
+    merged = merged.reindex(columns=fieldnames, fill_value='').fillna('')
+    merged.to_csv(output_path, index=False, encoding='utf-8', lineterminator='\r\n')
+    return True
+
+
+# Merge implementations by --backend name; 'csv' is the default
+BACKENDS = {'csv': write_merged, 'pandas': write_merged_pandas}
+
+
+def ordered_levels(pairs):
+    """(file, level) pairs sorted by level_order rank (stable; unknown levels last)."""
+    return sorted(pairs, key=lambda item: level_order.get(item[1], 4))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge the level vocabulary CSVs into one file.')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='csv',
+                        help='Merge implementation (default: csv, standard library only)')
+    args = parser.parse_args()
+    if args.backend == 'pandas' and pd is None:
+        parser.error('--backend pandas requires pandas')
+
+    # Levels never interleave, so the already sorted levels are simply
+    # concatenated in rank order; no merge or global sort is needed
+    written = BACKENDS[args.backend](ordered_levels(files_and_levels))
+    if written:
+        print(f"Merged CSV created: {output_file}")
+    else:
+        print("No data to merge.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Test that every merge_csvs backend writes the same bytes as the original
+DictReader/DictWriter merge.
+The fixture covers:
+1. Quoted fields with commas, doubled quotes and embedded newlines
+2. Short (ragged) rows, trailing commas (on one row and on every row of a
+   file) and a level file missing an output column
+3. CRLF and LF line endings, blank lines, unsorted and presorted levels
+4. Words pandas would read as NA ("NA", "null")
+"""
+import csv
+import os
+import tempfile
+
+import merge_csvs
+
+HEADER = ['Category', 'Word', 'Pinyin', 'English', 'POS', 'Role', 'Common_Usage', 'Example_Phrase']
+
+FIXTURE = {
+    # Unsorted, CRLF, a (Category, Word) tie and NA-like cells
+    'Basic': (
+        'Category,Word,Pinyin,English,POS,Role,Common_Usage,Example_Phrase\r\n'
+        'Verb,吃,chī,eat,V,predicate,Daily,我吃。\r\n'
+        'Noun,NA,na,not available,N,object,null,\r\n'
+        'Pronoun,我,wǒ,I,PRON,subject,Most common,我去。\r\n'
+        'Noun,NA,na,second tie,N,object,,\r\n'
+        '\r\n'
+        'Noun,书,shū,book,N,object,Reading,看书。\r\n'
+        # Trailing comma: one field more than the header
+        'Noun,水,shuǐ,water,N,object,Daily,喝水。,\r\n'
+    ),
+    # Quoting, embedded newline and a short row
+    'Intermediate': (
+        'Category,Word,Pinyin,English,POS,Role,Common_Usage,Example_Phrase\n'
+        'Noun,测试,cèshì,"test, ""quoted""",N,object,"two\nlines","a,b"\n'
+        'Adverb,再,zài\n'
+        'Adverb,也,yě,also,ADV,modifier,Common,我也去。\n'
+    ),
+    # Presorted, LF, no Example_Phrase column, trailing comma on every row
+    'Advanced': (
+        'Category,Word,Pinyin,English,POS,Role,Common_Usage\n'
+        'Adjective,复杂,fùzá,complex,ADJ,modifier,Formal,\n'
+        'Noun,经济,jīngjì,economy,N,object,News,\n'
+    ),
+}
+
+
+def reference_merge(ordered, output_path):
+    """
+    The original merge_csvs.py algorithm, kept as the expected output. The
+    original DictWriter raised on fields past the header; the backends drop
+    them, so the reference ignores them too.
+    """
+    level_order = {'Basic': 1, 'Intermediate': 2, 'Advanced': 3}
+    merged_data = []
+    for file, level in ordered:
+        if os.path.exists(file):
+            with open(file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    row['Level'] = level
+                    merged_data.append(row)
+    merged_data.sort(key=lambda x: (level_order.get(x['Level'], 4), x['Category'], x['Word']))
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=merge_csvs.fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(merged_data)
+
+
+def write_fixture(tmp_dir):
+    ordered = []
+    for level, text in FIXTURE.items():
+        path = os.path.join(tmp_dir, f'chinese_{level.lower()}.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        ordered.append((path, level))
+    # A listed level whose file does not exist is skipped
+    ordered.append((os.path.join(tmp_dir, 'chinese_missing.csv'), 'Missing'))
+    return merge_csvs.ordered_levels(ordered)
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_backends_match_reference():
+    """Each available backend's output equals the original merge, byte for byte"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ordered = write_fixture(tmp_dir)
+        expected_path = os.path.join(tmp_dir, 'expected.csv')
+        reference_merge(ordered, expected_path)
+        expected = read_bytes(expected_path)
+
+        for name, backend in merge_csvs.BACKENDS.items():
+            if name == 'pandas' and merge_csvs.pd is None:
+                print(f"  {name}: skipped (pandas not installed)")
+                continue
+            output_path = os.path.join(tmp_dir, f'{name}.csv')
+            assert backend(ordered, output_path), f"{name} wrote nothing"
+            assert read_bytes(output_path) == expected, f"{name} output differs from the original merge"
+            print(f"  {name}: ✓ matches")
+
+
+def test_backends_empty_input():
+    """With no input files every backend reports no data and writes nothing"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ordered = [(os.path.join(tmp_dir, 'chinese_basic.csv'), 'Basic')]
+        for name, backend in merge_csvs.BACKENDS.items():
+            if name == 'pandas' and merge_csvs.pd is None:
+                continue
+            output_path = os.path.join(tmp_dir, f'{name}.csv')
+            assert not backend(ordered, output_path), f"{name} reported data"
+            assert not os.path.exists(output_path), f"{name} created {output_path}"
+            print(f"  {name}: ✓ no output")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: MERGE_CSVS BACKENDS")
+    print("=" * 60)
+
+    test_backends_match_reference()
+    test_backends_empty_input()
+
+    print("\n" + "=" * 60)
+    print("ALL TESTS COMPLETE")
+    print("=" * 60)
+
+if __name__ == '__main__':
+    main()